@@ -8,32 +8,90 @@
 
 import re
 
-from svgwrite.data import pattern
 from svgwrite.data.colors import colornames
 from svgwrite.data.svgparser import is_valid_transferlist, is_valid_pathdata, is_valid_animation_timing
 from svgwrite.utils import is_string
 
+# leaf types which are never flattened any further
+_ATOMIC_TYPES = (int, float, str, bytes)
+
 def iterflatlist(values):
     """ Flatten nested *values*, returns an *iterator*. """
-    for element in values:
-        if hasattr(element, "__iter__") and not is_string(element):
-            for item in iterflatlist(element):
-                yield item
+    # iterative with an explicit stack: no recursion frame and no
+    # hasattr() probing per element
+    stack = [iter(values)]
+    while stack:
+        for element in stack[-1]:
+            if isinstance(element, _ATOMIC_TYPES):
+                yield element
+            else:
+                try:
+                    iterator = iter(element)
+                except TypeError:
+                    yield element
+                else:
+                    stack.append(iterator)
+                    break
         else:
-            yield element
+            stack.pop()
 
 INVALID_NAME_CHARS = frozenset([' ', '\t', '\r', '\n', ',', '(', ')'])
 WHITESPACE = frozenset([' ', '\t', '\r', '\n'])
-SHAPE_PATTERN = re.compile(r"^rect\((.*),(.*),(.*),(.*)\)$")
-FUNCIRI_PATTERN = re.compile(r"^url\((.*)\)$")
+# deletion table for is_name(), derived from INVALID_NAME_CHARS:
+# str.translate() scans in C without building a set of all characters
+# of the checked value
+_INVALID_NAME_TABLE = str.maketrans('', '', ''.join(INVALID_NAME_CHARS))
+# character classes instead of greedy '.*' groups: matches in linear time,
+# no catastrophic backtracking on adversarial input
+SHAPE_PATTERN = re.compile(r"\Arect\(([^,]*),([^,]*),([^,]*),([^)]*)\)\Z")
+FUNCIRI_PATTERN = re.compile(r"\Aurl\(([^)]*)\)\Z")
 ICCCOLOR_PATTERN = re.compile(r"^icc-color\((.*)\)$")
 COLOR_HEXDIGIT_PATTERN = re.compile(r"^#[a-fA-F0-9]{3}([a-fA-F0-9]{3})?$")
 COLOR_RGB_INTEGER_PATTERN = re.compile(r"^rgb\( *\d+ *, *\d+ *, *\d+ *\)$")
 COLOR_RGB_PERCENTAGE_PATTERN = re.compile(r"^rgb\( *\d+(\.\d*)?% *, *\d+(\.\d*)?% *, *\d+(\.\d*)?% *\)$")
 NMTOKEN_PATTERN = re.compile(r"^[a-zA-Z_:][\w\-\.:]*$")
 
+# hot-path patterns: capture the bound match methods once at import time,
+# saves one attribute lookup per validation call
+_SHAPE_MATCH = SHAPE_PATTERN.match
+_FUNCIRI_MATCH = FUNCIRI_PATTERN.match
+
+# unit identifiers of the number-with-unit types: checking a value is a
+# reverse scan for the unit suffix plus one frozenset lookup, faster than
+# matching the whole value against a regexp
+ANGLE_UNITS = frozenset(('deg', 'grad', 'rad', ''))
+FREQUENCY_UNITS = frozenset(('Hz', 'kHz', ''))
+LENGTH_UNITS = frozenset(('em', 'ex', 'px', 'in', 'cm', 'mm', 'pt', 'pc', '%', ''))
+TIME_UNITS = frozenset(('s', 'ms', ''))
+
+def _split_number_unit(value):
+    """ Split *value* into (number, unit) strings at the last digit or '.'. """
+    i = len(value)
+    while i and value[i-1] not in '0123456789.':
+        i -= 1
+    return value[:i], value[i:]
+
+# fast paths for is_number()/is_integer(): check numeric strings with a
+# compiled regexp instead of raising and catching ValueError
+_NUMERIC_TYPES = (int, float)
+_NUMBER_MATCH = re.compile(r"\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*\Z").match
+_INTEGER_MATCH = re.compile(r"\s*[-+]?\d+\s*\Z").match
+#number-optional-number ::= number | number comma-wsp number
+_NUM_OPT_NUM_MATCH = re.compile(
+    r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"(?:\s*[, ]\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?))?\s*\Z").match
+#comma-wsp ::= (wsp+ ","? wsp*) | ("," wsp*) -- at most one comma per
+# separator, so ',,' produces an empty token and the list is rejected
+_COMMA_WSP_SPLIT = re.compile(r"\s+,?\s*|,\s*").split
+
 
 class Full11TypeChecker(object):
+    def __init__(self):
+        # cache for resolved checker funcs, bound methods are instance
+        # specific and must not be shared between subclasses
+        self._func_cache = {}
+        self._check_cache = {}
+
     def get_version(self):
         return '1.1', 'full'
 
@@ -42,10 +100,12 @@ class Full11TypeChecker(object):
         if self.is_number(value):
             return True
         elif is_string(value):
-            return pattern.angle.match(value.strip()) is not None
+            number, unit = _split_number_unit(value.strip())
+            return unit in ANGLE_UNITS and _NUMBER_MATCH(number) is not None
         return False
 
-    def is_anything(self, value):
+    @staticmethod
+    def is_anything(value):
         #anything ::= Char*
         return bool(str(value).strip())
     is_string = is_anything
@@ -72,7 +132,8 @@ class Full11TypeChecker(object):
             return False
         return self.is_color_keyword(value)
 
-    def is_color_keyword(self, value):
+    @staticmethod
+    def is_color_keyword(value):
         return value.strip() in colornames
 
     def is_frequency(self, value):
@@ -80,12 +141,13 @@ class Full11TypeChecker(object):
         if self.is_number(value):
             return True
         elif is_string(value):
-            return pattern.frequency.match(value.strip()) is not None
+            number, unit = _split_number_unit(value.strip())
+            return unit in FREQUENCY_UNITS and _NUMBER_MATCH(number) is not None
         return False
 
     def is_FuncIRI(self, value):
         # FuncIRI ::= "url(" <IRI> ")"
-        res = FUNCIRI_PATTERN.match(str(value).strip())
+        res = _FUNCIRI_MATCH(str(value).strip())
         if res:
             return self.is_IRI(res.group(1))
         return False
@@ -97,16 +159,22 @@ class Full11TypeChecker(object):
             return self.is_list_of_T(res.group(1), 'name')
         return False
 
-    def is_integer(self, value):
+    @staticmethod
+    def is_integer(value):
         if isinstance(value, float):
             return False
+        if isinstance(value, int):
+            return True
+        if is_string(value):
+            return _INTEGER_MATCH(value) is not None
         try:
             number = int(value)
             return True
-        except:
+        except (TypeError, ValueError):
             return False
 
-    def is_IRI(self, value):
+    @staticmethod
+    def is_IRI(value):
         # Internationalized Resource Identifiers
         # a more generalized complement to Uniform Resource Identifiers (URIs)
         # nearly everything can be a valid <IRI>
@@ -120,24 +188,27 @@ class Full11TypeChecker(object):
         # length ::= number ("em" | "ex" | "px" | "in" | "cm" | "mm" | "pt" | "pc" | "%")?
         if value is None:
             return False
-        if isinstance(value, (int, float)):
-            return self.is_number(value)
+        if isinstance(value, _NUMERIC_TYPES):
+            return value == value  # inlined is_number(), rejects NaN
         elif is_string(value):
-            result = pattern.length.match(value.strip())
-            if result:
-                number, tmp, unit = result.groups()
-                return self.is_number(number) # for tiny check!
+            number, unit = _split_number_unit(value.strip())
+            # inlined is_number() call: saves a call frame on one of the
+            # hottest validators; Tiny12TypeChecker overrides is_length()
+            # to keep its value range check
+            return unit in LENGTH_UNITS and _NUMBER_MATCH(number) is not None
         return False
 
     is_coordinate = is_length
 
     def is_list_of_T(self, value, t='string'):
         def split(value):
-            #TODO: improve split function!!!!
             if isinstance(value, (int, float)):
                 return (value, )
             if is_string(value):
-                return iterflatlist(v.split(',') for v in value.split(' '))
+                # one grammar-correct pass for all list types and profiles;
+                # empty tokens (empty value, '1,,2', surrounding wsp) fail
+                # the checker and make the whole list invalid
+                return _COMMA_WSP_SPLIT(value)
             return value
         #list-of-Ts ::= T
         #               | T comma-wsp list-of-Ts
@@ -173,31 +244,36 @@ class Full11TypeChecker(object):
         #wsp        ::= (#x20 | #x9 | #xD | #xA)
         return self.is_list_of_T(value.replace(';', ' '), 'string')
 
-    def is_name(self, value):
+    @staticmethod
+    def is_name(value):
         # name  ::= [^,()#x20#x9#xD#xA] /* any char except ",", "(", ")" or wsp */
-        chars = frozenset(str(value).strip())
-        if not chars or INVALID_NAME_CHARS.intersection(chars):
-            return False
-        else:
-            return True
-
-    def is_number(self, value):
+        name = str(value).strip()
+        # no invalid char present <=> deleting them does not change the length
+        return bool(name) and len(name.translate(_INVALID_NAME_TABLE)) == len(name)
+
+    @staticmethod
+    def is_number(value):
+        if isinstance(value, _NUMERIC_TYPES):
+            return value == value  # reject NaN
+        if is_string(value):
+            return _NUMBER_MATCH(value) is not None
         try:
             number = float(value)
             return True
-        except:
+        except (TypeError, ValueError):
             return False
 
     def is_number_optional_number(self, value):
         #number-optional-number ::= number
         #                           | number comma-wsp number
         if is_string(value):
-            values = re.split('[ ,]+', value.strip())
-            if 0 < len(values) < 3: # 1 or 2 numbers
-                for v in values:
-                    if not self.is_number(v):
-                        return False
-                return True
+            result = _NUM_OPT_NUM_MATCH(value)
+            if result is None:
+                return False
+            number1, number2 = result.groups()
+            # is_number() dispatch keeps the Tiny12 value range check
+            return self.is_number(number1) and \
+                   (number2 is None or self.is_number(number2))
         else:
             try: # is it a 2-tuple
                 n1, n2 = value
@@ -243,7 +319,8 @@ class Full11TypeChecker(object):
         if self.is_number(value):
             return True
         elif is_string(value):
-            return pattern.percentage.match(value.strip()) is not None
+            number, unit = _split_number_unit(value.strip())
+            return unit == '%' and _NUMBER_MATCH(number) is not None
         return False
 
     def is_time(self, value):
@@ -251,22 +328,26 @@ class Full11TypeChecker(object):
         if self.is_number(value):
             return True
         elif is_string(value):
-            return pattern.time.match(value.strip()) is not None
+            number, unit = _split_number_unit(value.strip())
+            return unit in TIME_UNITS and _NUMBER_MATCH(number) is not None
         return False
 
-    def is_transform_list(self, value):
+    @staticmethod
+    def is_transform_list(value):
         if is_string(value):
             return is_valid_transferlist(value)
         else:
             return False
 
-    def is_path_data(self, value):
+    @staticmethod
+    def is_path_data(value):
         if is_string(value):
             return is_valid_pathdata(value)
         else:
             return False
 
-    def is_XML_Name(self, value):
+    @staticmethod
+    def is_XML_Name(value):
         # http://www.w3.org/TR/2006/REC-xml-20060816/#NT-Name
         # Nmtoken
         return bool(NMTOKEN_PATTERN.match(str(value).strip()))
@@ -277,7 +358,7 @@ class Full11TypeChecker(object):
         # respective sides of the box.
         # <top>, <right>, <bottom>, and <left> are <length> values
         # i.e. 'rect(5px, 10px, 10px, 5px)'
-        res = SHAPE_PATTERN.match(value.strip())
+        res = _SHAPE_MATCH(value.strip())
         if res:
             for arg in res.groups():
                 if arg.strip() == 'auto':
@@ -288,7 +369,8 @@ class Full11TypeChecker(object):
             return False
         return True
 
-    def is_timing_value_list(self, value):
+    @staticmethod
+    def is_timing_value_list(value):
         if is_string(value):
             return is_valid_animation_timing(value)
         else:
@@ -297,19 +379,35 @@ class Full11TypeChecker(object):
     def is_list_of_text_decoration_style(self, value):
         return self.is_list_of_T(value, t='text_decoration_style')
 
-    def is_text_decoration_style(self, value):
+    @staticmethod
+    def is_text_decoration_style(value):
         return value in ('overline', 'underline', 'line-through', 'blink')
 
     def get_func_by_name(self, funcname):
-        return getattr(self,
-                       'is_'+funcname.replace('-', '_'),
-                       self.is_anything)
+        try:
+            return self._func_cache[funcname]
+        except KeyError:
+            func = getattr(self,
+                           'is_'+funcname.replace('-', '_'),
+                           self.is_anything)
+            self._func_cache[funcname] = func
+            return func
 
     def check(self, typename, value):
-        if typename.startswith('list-of-'):
-            t = typename[8:]
-            return self.is_list_of_T(value, t)
-        return self.get_func_by_name(typename)(value)
+        if is_string(value):
+            # normalize once: str.strip() of an already stripped string
+            # returns the same object, so the strip() calls inside the
+            # individual validators degrade to cheap no-ops
+            value = value.strip()
+        try:
+            is_list, func_or_t = self._check_cache[typename]
+        except KeyError:
+            is_list = typename.startswith('list-of-')
+            func_or_t = typename[8:] if is_list else self.get_func_by_name(typename)
+            self._check_cache[typename] = (is_list, func_or_t)
+        if is_list:
+            return self.is_list_of_T(value, func_or_t)
+        return func_or_t(value)
 
 
 FOCUS_CONST = frozenset(['nav-next', 'nav-prev', 'nav-up', 'nav-down', 'nav-left',
@@ -321,22 +419,43 @@ class Tiny12TypeChecker(Full11TypeChecker):
     def get_version(self):
         return '1.2', 'tiny'
 
-    def is_boolean(self, value):
+    @staticmethod
+    def is_boolean(value):
         if isinstance(value, bool):
             return True
         if is_string(value):
             return value.strip().lower() in ('true', 'false')
         return False
 
-    def is_number(self, value):
-        try:
+    @staticmethod
+    def is_number(value):
+        if isinstance(value, _NUMERIC_TYPES):
+            number = value
+        elif is_string(value):
+            if _NUMBER_MATCH(value) is None:
+                return False
             number = float(value)
-            if -32767.9999 <= number <= 32767.9999:
-                return True
-            else:
+        else:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
                 return False
-        except:
+        return -32767.9999 <= number <= 32767.9999
+
+    def is_length(self, value):
+        # Full11TypeChecker.is_length() inlines the number check; the tiny
+        # profile restricts the value range, so dispatch to is_number()
+        if value is None:
             return False
+        if isinstance(value, _NUMERIC_TYPES):
+            return self.is_number(value)
+        elif is_string(value):
+            number, unit = _split_number_unit(value.strip())
+            return unit in LENGTH_UNITS and self.is_number(number)
+        return False
+
+    is_coordinate = is_length
 
-    def is_focus(self, value):
+    @staticmethod
+    def is_focus(value):
         return str(value).strip() in FOCUS_CONST
@@ -9,12 +9,15 @@
 from svgwrite.base import BaseElement
 from svgwrite.mixins import Presentation, Markers, Transform
 
+_NUMERIC_TYPES = (int, float)
+
 
 class Line(BaseElement, Transform, Presentation, Markers):
     """ The **line** element defines a line segment that starts at one point
     and ends at another.
     """
     elementname = 'line'
+    __slots__ = ()
 
     def __init__(self, start=(0, 0), end=(0, 0), **extra):
         """
@@ -23,13 +26,23 @@ class Line(BaseElement, Transform, Presentation, Markers):
         :param extra: additional SVG attributes as keyword-arguments
 
         """
-        super(Line, self).__init__(**extra)
+        # direct base class call: the mixins define no __init__, this skips
+        # the MRO walk of super() on a hot construction path
+        BaseElement.__init__(self, **extra)
         x1, y1 = start
         x2, y2 = end
-        self['x1'] = x1
-        self['y1'] = y1
-        self['x2'] = x2
-        self['y2'] = y2
+        if self.debug:
+            self['x1'] = x1
+            self['y1'] = y1
+            self['x2'] = x2
+            self['y2'] = y2
+        else:
+            # fast path: skip the __setitem__ dispatch per attribute
+            attribs = self.attribs
+            attribs['x1'] = x1
+            attribs['y1'] = y1
+            attribs['x2'] = x2
+            attribs['y2'] = y2
 
 
 class Rect(BaseElement, Transform, Presentation):
@@ -38,6 +51,7 @@ class Rect(BaseElement, Transform, Presentation):
     values for attributes **rx** and **ry**.
     """
     elementname = 'rect'
+    __slots__ = ()
 
     def __init__(self, insert=(0, 0), size=(1, 1), rx=None, ry=None, **extra):
         """
@@ -48,23 +62,38 @@ class Rect(BaseElement, Transform, Presentation):
         :param extra: additional SVG attributes as keyword-arguments
 
         """
-        super(Rect, self).__init__(**extra)
+        # direct base class call: the mixins define no __init__, this skips
+        # the MRO walk of super() on a hot construction path
+        BaseElement.__init__(self, **extra)
         x, y = insert
         width, height = size
-        self['x'] = x
-        self['y'] = y
-        self['width'] = width
-        self['height'] = height
-        if rx is not None:
-            self['rx'] = rx
-        if ry is not None:
-            self['ry'] = ry
+        if self.debug:
+            self['x'] = x
+            self['y'] = y
+            self['width'] = width
+            self['height'] = height
+            if rx is not None:
+                self['rx'] = rx
+            if ry is not None:
+                self['ry'] = ry
+        else:
+            # fast path: skip the __setitem__ dispatch per attribute
+            attribs = self.attribs
+            attribs['x'] = x
+            attribs['y'] = y
+            attribs['width'] = width
+            attribs['height'] = height
+            if rx is not None:
+                attribs['rx'] = rx
+            if ry is not None:
+                attribs['ry'] = ry
 
 
 class Circle(BaseElement, Transform, Presentation):
     """ The **circle** element defines a circle based on a center point and a radius.
     """
     elementname = 'circle'
+    __slots__ = ()
 
     def __init__(self, center=(0, 0), r=1, **extra):
         """
@@ -73,11 +102,20 @@ class Circle(BaseElement, Transform, Presentation):
         :param extra: additional SVG attributes as keyword-arguments
 
         """
-        super(Circle, self).__init__(**extra)
+        # direct base class call: the mixins define no __init__, this skips
+        # the MRO walk of super() on a hot construction path
+        BaseElement.__init__(self, **extra)
         cx, cy = center
-        self['cx'] = cx
-        self['cy'] = cy
-        self['r'] = r
+        if self.debug:
+            self['cx'] = cx
+            self['cy'] = cy
+            self['r'] = r
+        else:
+            # fast path: skip the __setitem__ dispatch per attribute
+            attribs = self.attribs
+            attribs['cx'] = cx
+            attribs['cy'] = cy
+            attribs['r'] = r
 
 
 class Ellipse(BaseElement, Transform, Presentation):
@@ -85,6 +123,7 @@ class Ellipse(BaseElement, Transform, Presentation):
     current user coordinate system based on a center point and two radii.
     """
     elementname = 'ellipse'
+    __slots__ = ()
 
     def __init__(self, center=(0, 0), r=(1, 1), **extra):
         """
@@ -93,13 +132,23 @@ class Ellipse(BaseElement, Transform, Presentation):
         :param extra: additional SVG attributes as keyword-arguments
 
         """
-        super(Ellipse, self).__init__(**extra)
+        # direct base class call: the mixins define no __init__, this skips
+        # the MRO walk of super() on a hot construction path
+        BaseElement.__init__(self, **extra)
         cx, cy = center
         rx, ry = r
-        self['cx'] = cx
-        self['cy'] = cy
-        self['rx'] = rx
-        self['ry'] = ry
+        if self.debug:
+            self['cx'] = cx
+            self['cy'] = cy
+            self['rx'] = rx
+            self['ry'] = ry
+        else:
+            # fast path: skip the __setitem__ dispatch per attribute
+            attribs = self.attribs
+            attribs['cx'] = cx
+            attribs['cy'] = cy
+            attribs['rx'] = rx
+            attribs['ry'] = ry
 
 
 class Polyline(BaseElement, Transform, Presentation, Markers):
@@ -107,6 +156,7 @@ class Polyline(BaseElement, Transform, Presentation, Markers):
     segments. Typically, **polyline** elements define open shapes.
     """
     elementname = 'polyline'
+    __slots__ = ('points',)
 
     def __init__(self, points=[], **extra):
         """
@@ -114,13 +164,36 @@ class Polyline(BaseElement, Transform, Presentation, Markers):
         :param extra: additional SVG attributes as keyword-arguments
 
         """
-        super(Polyline, self).__init__(**extra)
-        self.points = list(points)
+        # direct base class call: the mixins define no __init__, this skips
+        # the MRO walk of super() on a hot construction path
+        BaseElement.__init__(self, **extra)
         if self.debug:
-            for point in self.points:
-                x, y = point
-                self.validator.check_svg_type(x, 'number')
-                self.validator.check_svg_type(y, 'number')
+            # single pass: validate while materializing the point list
+            # instead of copying the input first and iterating it again
+            pts = []
+            append = pts.append
+            check = self.validator.check_svg_type
+            if self.profile == 'tiny':
+                # the tiny profile restricts the value range of numbers,
+                # every point has to go through the validator
+                for point in points:
+                    x, y = point
+                    check(x, 'number')
+                    check(y, 'number')
+                    append(point)
+            else:
+                # bulk fast path: plain (non-NaN) numbers are always valid
+                # numbers, only other values need the full validator
+                for point in points:
+                    x, y = point
+                    if not isinstance(x, _NUMERIC_TYPES) or x != x:
+                        check(x, 'number')
+                    if not isinstance(y, _NUMERIC_TYPES) or y != y:
+                        check(y, 'number')
+                    append(point)
+            self.points = pts
+        else:
+            self.points = list(points)
 
     def get_xml(self):
         self.attribs['points'] = self.points_to_string(self.points)
@@ -131,21 +204,26 @@ class Polyline(BaseElement, Transform, Presentation, Markers):
         Convert a `list` of points `2-tuples` to a `string` ``'p1x,p1y p2x,p2y ...'``.
 
         """
+        # hoist debug/profile lookups out of the loop, they are properties
+        # and would cost two attribute lookups per point
+        debug = self.debug
+        tiny = self.profile == 'tiny'
+        check = self.validator.check_svg_type if debug else None
         strings = []
+        append = strings.append
         for point in points:
             if len(point) != 2:
                 raise TypeError('got %s values, but expected 2 values.' % len(point))
             x, y = point
-            if self.debug:
-                self.validator.check_svg_type(x, 'coordinate')
-                self.validator.check_svg_type(y, 'coordinate')
-            if self.profile == 'tiny':
+            if debug:
+                check(x, 'coordinate')
+                check(y, 'coordinate')
+            if tiny:
                 if isinstance(x, float):
                     x = round(x, 4)
                 if isinstance(y, float):
                     y = round(y, 4)
-            point = "%s,%s" % (x, y)
-            strings.append(point)
+            append("%s,%s" % (x, y))
         return ' '.join(strings)
 
 
@@ -156,4 +234,5 @@ class Polygon(Polyline):
     Same as :class:`~svgwrite.shapes.Polyline` but closed.
     """
     elementname = 'polygon'
+    __slots__ = ()
 
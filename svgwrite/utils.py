@@ -71,17 +71,32 @@ def rgb(r=0, g=0, b=0, mode='RGB'):
         raise ValueError("Invalid mode '%s'" % mode)
 
 
+# leaf types which are never flattened any further
+_ATOMIC_TYPES = (int, float, str, bytes)
+
+
 def iterflatlist(values):
     """
     Flatten nested *values*, returns an `iterator`.
 
     """
-    for element in values:
-        if hasattr(element, "__iter__") and not is_string(element):
-            for item in iterflatlist(element):
-                yield item
+    # iterative with an explicit stack: no recursion frame and no
+    # hasattr() probing per element
+    stack = [iter(values)]
+    while stack:
+        for element in stack[-1]:
+            if isinstance(element, _ATOMIC_TYPES):
+                yield element
+            else:
+                try:
+                    iterator = iter(element)
+                except TypeError:
+                    yield element
+                else:
+                    stack.append(iterator)
+                    break
         else:
-            yield element
+            stack.pop()
 
 
 def strlist(values, seperator=","):
@@ -47,6 +47,11 @@ class TestFull11TypeChecker(unittest.TestCase):
         self.assertFalse(self.checker.is_number( (1,2) ))
         self.assertFalse(self.checker.is_number('manfred'))
         self.assertFalse(self.checker.is_number( dict(a=1, b=2) ))
+        # accepted by float() but not valid SVG numbers
+        self.assertFalse(self.checker.is_number(float('nan')))
+        self.assertFalse(self.checker.is_number('inf'))
+        self.assertFalse(self.checker.is_number('nan'))
+        self.assertFalse(self.checker.is_number('1_000'))
 
     def test_is_name(self):
         self.assertTrue(self.checker.is_name('mozman-öäüß'))
@@ -45,6 +45,36 @@ class TestTiny12TypeChecker(unittest.TestCase):
         self.assertFalse(self.checker.is_number(-100000))
         self.assertFalse(self.checker.is_number('100000'))
         self.assertFalse(self.checker.is_number('-100000'))
+        # accepted by float() but not valid SVG numbers
+        self.assertFalse(self.checker.is_number(float('nan')))
+        self.assertFalse(self.checker.is_number('inf'))
+        self.assertFalse(self.checker.is_number('nan'))
+        self.assertFalse(self.checker.is_number('1_000'))
+
+    def test_is_length(self):
+        # value range is also restricted for unit-suffixed lengths
+        self.assertTrue(self.checker.is_length(100))
+        self.assertTrue(self.checker.is_length(-100.5))
+        self.assertTrue(self.checker.is_length('100'))
+        self.assertTrue(self.checker.is_length(' 100px '))
+        self.assertTrue(self.checker.is_length(' -100mm '))
+        self.assertTrue(self.checker.is_length('32767.9999'))
+    def test_is_not_length(self):
+        # big numbers only valid for full profile
+        self.assertFalse(self.checker.is_length(100000))
+        self.assertFalse(self.checker.is_length(-100000))
+        self.assertFalse(self.checker.is_length('100000'))
+        self.assertFalse(self.checker.is_length('40000px'))
+        self.assertFalse(self.checker.is_length('-40000mm'))
+        self.assertFalse(self.checker.is_length('100km'))
+        self.assertFalse(self.checker.is_length(' mozman '))
+
+    def test_is_coordinate(self):
+        self.assertTrue(self.checker.is_coordinate(100))
+        self.assertTrue(self.checker.is_coordinate(' 100px '))
+    def test_is_not_coordinate(self):
+        self.assertFalse(self.checker.is_coordinate(100000))
+        self.assertFalse(self.checker.is_coordinate('40000px'))
 
     def test_is_focus(self):
         for focus in  [' nav-next ', ' nav-prev ', ' nav-up ', ' nav-down ',